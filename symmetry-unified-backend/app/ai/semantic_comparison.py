@@ -1,6 +1,23 @@
+import functools
+import os
+import re
+
+import numpy as np
+import torch
 from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 import spacy
+
+from app.services.embedding_cache import get_cached_embeddings, set_cached_embeddings
+
+try:
+    import simsimd
+except ImportError:  # optional SIMD-optimized similarity kernels
+    simsimd = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # optional JIT for the non-SimSIMD similarity path
+    njit = None
 comparison_models = [
     "sentence-transformers/LaBSE",
     "xlm-roberta-base",
@@ -9,6 +26,250 @@ comparison_models = [
     "multi-qa-mpnet-base-cos-v1"
 ]
 
+# Transformer inference runs on the GPU when one is present; encoding
+# throughput is an order of magnitude higher than on CPU
+_DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
+
+# Candidate sentences are compared in column blocks of this size so rows
+# with an early strong match skip the rest of the matrix
+_COLUMN_BLOCK = 256
+
+# Query sentences are processed in tiles of this many rows, keeping each
+# 128x256 similarity block in cache instead of materializing the full NxM
+# matrix for long articles
+_ROW_TILE = 128
+
+# Above this many sentences, CPU encoding is spread across a process pool;
+# below it, pool startup costs more than it saves
+_MULTI_PROCESS_THRESHOLD = 1000
+
+# Sentence terminators for the language-agnostic fallback splitter
+_SENT_SPLIT = re.compile(r"[.!?]+\s*")
+
+# Runs of newlines: a double newline is a paragraph break (joined with a
+# space), a single newline ends a title/line and becomes a period
+_NEWLINE_RUN = re.compile(r"\n+")
+
+
+def _resolve_model_name(model_name):
+    """
+    Maps unknown model names to the LaBSE default, matching the previous
+    match/case behaviour.
+    """
+    if model_name not in comparison_models:
+        return "sentence-transformers/LaBSE"
+    return model_name
+
+
+@functools.lru_cache(maxsize=8)
+def _get_model(model_name):
+    """
+    Returns a cached SentenceTransformer instance for the given model name.
+
+    Loading a model re-reads the weights from disk and rebuilds the PyTorch
+    modules, which takes seconds per call; caching keeps one instance per
+    model name alive for the process lifetime.
+    """
+    return SentenceTransformer(_resolve_model_name(model_name), device=_DEVICE)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_nlp(language):
+    """
+    Returns a cached rule-based sentence splitter for the given language code.
+
+    Sentence boundaries are all this module consumes, so a blank pipeline
+    with a sentencizer replaces the full spaCy models (tagger, parser, NER)
+    that were loaded before — no model download and a fraction of the work
+    per document.
+    """
+    nlp = spacy.blank(language)
+    nlp.add_pipe("sentencizer")
+    return nlp
+
+
+@functools.lru_cache(maxsize=8)
+def _get_encode_pool(model_name):
+    """
+    Returns a persistent multi-process encode pool for the given model.
+
+    Spawning a pool per request would make every worker reload the model
+    before encoding begins; keeping one pool per model amortizes that cost
+    across requests. Workers inherit OMP_NUM_THREADS=1 so pool processes
+    do not oversubscribe the cores they share.
+    """
+    model = _get_model(model_name)
+    previous = os.environ.get("OMP_NUM_THREADS")
+    os.environ["OMP_NUM_THREADS"] = "1"
+    try:
+        return model.start_multi_process_pool()
+    finally:
+        if previous is None:
+            os.environ.pop("OMP_NUM_THREADS", None)
+        else:
+            os.environ["OMP_NUM_THREADS"] = previous
+
+
+def _encode_batch(model_name, model, sentences):
+    """
+    Runs the transformer over a list of sentences, returning unit-norm
+    float32 embeddings.
+
+    Very large CPU batches (whole long articles) are spread across a
+    persistent multi-process pool, since single-process encoding saturates
+    one core while PyTorch's internal threading plateaus.
+    """
+    if _DEVICE == "cpu" and len(sentences) > _MULTI_PROCESS_THRESHOLD:
+        pool = _get_encode_pool(model_name)
+        encoded = model.encode_multi_process(sentences, pool, batch_size=64)
+        # encode_multi_process skips normalization; restore unit norms so a
+        # dot product stays the cosine
+        encoded = np.asarray(encoded, dtype=np.float32)
+        norms = np.linalg.norm(encoded, axis=1, keepdims=True)
+        np.divide(encoded, norms, out=encoded, where=norms != 0)
+        return encoded
+
+    return model.encode(
+        sentences,
+        batch_size=64,
+        normalize_embeddings=True,
+        convert_to_numpy=True,
+        show_progress_bar=False,
+        device=_DEVICE,
+    )
+
+
+def _encode_sentences(model_name, model, sentences):
+    """
+    Encodes a list of sentences to unit-norm embeddings, serving repeated
+    sentences from the on-disk embedding cache and batching only the misses
+    through the transformer.
+    """
+    if not sentences:
+        return np.empty((0, 0), dtype=np.float32)
+
+    embeddings = get_cached_embeddings(model_name, sentences)
+    miss_indices = [i for i, vec in enumerate(embeddings) if vec is None]
+
+    if miss_indices:
+        miss_sentences = [sentences[i] for i in miss_indices]
+        encoded = _encode_batch(model_name, model, miss_sentences)
+        set_cached_embeddings(model_name, miss_sentences, encoded)
+        for i, vector in zip(miss_indices, encoded):
+            embeddings[i] = np.asarray(vector, dtype=np.float32)
+
+    return np.vstack(embeddings)
+
+
+def _quantize_int8(embeddings):
+    """
+    Symmetric int8 quantization of unit-norm embeddings.
+
+    Components of a normalized embedding lie in [-1, 1], so scaling by 127
+    uses the full int8 range. Cosine similarity is scale-invariant, which
+    makes the quantized vectors drop-in for a thresholded comparison.
+    """
+    return np.round(embeddings.astype(np.float32) * 127.0).astype(np.int8)
+
+
+def _similarity_matrix(first_embeddings, second_embeddings):
+    """
+    Computes the pairwise cosine-similarity matrix with the fastest kernel
+    available: SimSIMD when installed (int8-quantized inputs), otherwise
+    the einsum-normalized float matmul.
+    """
+    if simsimd is not None:
+        # Dispatches to AVX-512/NEON kernels (VNNI int8 dot products when
+        # the inputs are quantized)
+        return 1.0 - np.asarray(
+            simsimd.cdist(first_embeddings, second_embeddings, metric="cosine")
+        )
+    return _cosine_matrix(first_embeddings, second_embeddings)
+
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _diff_mask_numba(A, B, sim_threshold):
+        """Parallel dot-product scan over unit-norm float32 embeddings:
+        True for each row of A with no match in B at or above the
+        threshold. Rows short-circuit on the first match and no NxM
+        temporary is ever allocated."""
+        n = A.shape[0]
+        out = np.zeros(n, dtype=np.bool_)
+        for i in prange(n):
+            matched = False
+            for j in range(B.shape[0]):
+                s = 0.0
+                for k in range(A.shape[1]):
+                    s += A[i, k] * B[j, k]
+                if s >= sim_threshold:
+                    matched = True
+                    break
+            out[i] = not matched
+        return out
+
+else:
+    _diff_mask_numba = None
+
+
+def _unmatched_mask(first_embeddings, second_embeddings, sim_threshold):
+    """
+    Flags rows of first_embeddings that have no counterpart in
+    second_embeddings at or above the threshold.
+
+    We never need the maximum similarity, only whether any candidate
+    clears the threshold, so the comparison runs over row tiles x column
+    blocks: each block stays cache-resident instead of spilling an NxM
+    matrix to DRAM on long articles, and rows that already found a match
+    drop out of later blocks. On largely aligned articles (the typical
+    translation pair) most rows match in the first block.
+    """
+    if simsimd is None and _diff_mask_numba is not None:
+        # The JIT kernel fuses dot product, threshold test, and per-row
+        # early exit without NumPy temporaries; embeddings stay unit-norm
+        # float on this path since quantization is SimSIMD-only
+        A = np.ascontiguousarray(first_embeddings, dtype=np.float32)
+        B = np.ascontiguousarray(second_embeddings, dtype=np.float32)
+        return _diff_mask_numba(A, B, sim_threshold)
+
+    unmatched = np.zeros(first_embeddings.shape[0], dtype=bool)
+
+    for row_start in range(0, first_embeddings.shape[0], _ROW_TILE):
+        tile = first_embeddings[row_start:row_start + _ROW_TILE]
+        found = np.zeros(tile.shape[0], dtype=bool)
+        active = np.arange(tile.shape[0])
+
+        for col_start in range(0, second_embeddings.shape[0], _COLUMN_BLOCK):
+            block = second_embeddings[col_start:col_start + _COLUMN_BLOCK]
+            sims = _similarity_matrix(tile[active], block)
+            matched = (sims >= sim_threshold).any(axis=1)
+            found[active[matched]] = True
+            active = active[~matched]
+            if active.size == 0:
+                break
+
+        unmatched[row_start:row_start + tile.shape[0]] = ~found
+
+    return unmatched
+
+
+def _cosine_matrix(X, Y):
+    """
+    Computes the full pairwise cosine-similarity matrix between two
+    embedding matrices.
+
+    Norms come from a single einsum per matrix rather than per-row
+    np.linalg.norm calls, and zero-norm rows yield 0 similarity instead of
+    a division warning.
+    """
+    norms_x = np.sqrt(np.einsum("ij,ij->i", X, X))
+    norms_y = np.sqrt(np.einsum("ij,ij->i", Y, Y))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sims = (X @ Y.T) / np.outer(norms_x, norms_y)
+    return np.nan_to_num(sims, copy=False)
+
+
 def semantic_compare(model_name, og_article, translated_article, source_language, target_language, sim_threshold):  # main function
     """
     semantic_compare(model_name, og_article, translated_article, source_language, target_language, sim_threshold)
@@ -33,32 +294,61 @@ def semantic_compare(model_name, og_article, translated_article, source_language
     }
     """
     # Load a multilingual sentence transformer model (LaBSE or cmlm)
-    match model_name:
-        case "sentence-transformers/LaBSE":
-            model = SentenceTransformer('sentence-transformers/LaBSE')
-        case "xlm-roberta-base":
-            model = SentenceTransformer('xlm-roberta-base')
-        case "multi-qa-distilbert-cos-v1":
-            model = SentenceTransformer('multi-qa-distilbert-cos-v1')
-        case "multi-qa-MiniLM-L6-cos-v1":
-            model = SentenceTransformer('multi-qa-MiniLM-L6-cos-v1')
-        case "multi-qa-mpnet-base-cos-v1":
-            model = SentenceTransformer('multi-qa-mpnet-base-cos-v1')
-        case _:   
-            model = SentenceTransformer('sentence-transformers/LaBSE') 
+    model_name = _resolve_model_name(model_name)
+    model = _get_model(model_name)
 
     og_article_sentences = preprocess_input(og_article, source_language)
     translated_article_sentences = preprocess_input(translated_article, target_language)
 
-    # encode the sentences
-    og_embeddings = model.encode(og_article_sentences)
-    translated_embeddings = model.encode(translated_article_sentences)
-
     if sim_threshold is None:
         sim_threshold = 0.75
 
-    missing_info, missing_info_index = sentences_diff(og_article_sentences, og_embeddings, translated_embeddings, sim_threshold)
-    extra_info, extra_info_index = sentences_diff(translated_article_sentences, translated_embeddings, og_embeddings, sim_threshold)
+    # Sentences appearing verbatim in both articles (copied names, dates,
+    # reference lines) are trivially matched and skip the similarity scan
+    # as queries. They stay in the candidate pools: a paraphrase may have
+    # its only match in a shared sentence, and the embedding cache makes
+    # their (re-)encoding cheap.
+    og_keys = [s.strip().lower() for s in og_article_sentences]
+    translated_keys = [s.strip().lower() for s in translated_article_sentences]
+    common = set(og_keys) & set(translated_keys)
+    og_query = [i for i, key in enumerate(og_keys) if key not in common]
+    translated_query = [i for i, key in enumerate(translated_keys) if key not in common]
+
+    if not og_query and not translated_query:
+        return og_article_sentences, translated_article_sentences, [], []
+
+    # Encode both articles in one call (unit-norm so a plain dot product is
+    # the cosine): a single batch lets the tokenizer run once and lets
+    # sentence-transformers group similar-length sentences, cutting padding
+    all_embeddings = _encode_sentences(
+        model_name, model, og_article_sentences + translated_article_sentences
+    )
+    if simsimd is not None:
+        # Quantize for the similarity step: 4x less memory traffic than
+        # fp32 and int8 dot products map onto VNNI/NEON instructions. Only
+        # the SimSIMD kernels profit - NumPy has no fast integer matmul, so
+        # the fallback paths keep float32 for BLAS
+        all_embeddings = _quantize_int8(all_embeddings)
+    split_at = len(og_article_sentences)
+    og_embeddings = all_embeddings[:split_at]
+    translated_embeddings = all_embeddings[split_at:]
+
+    missing_info, missing_query_index = sentences_diff(
+        [og_article_sentences[i] for i in og_query],
+        og_embeddings[og_query],
+        translated_embeddings,
+        sim_threshold,
+    )
+    extra_info, extra_query_index = sentences_diff(
+        [translated_article_sentences[i] for i in translated_query],
+        translated_embeddings[translated_query],
+        og_embeddings,
+        sim_threshold,
+    )
+
+    # Map query positions back to indices in the full sentence lists
+    missing_info_index = [og_query[i] for i in missing_query_index]
+    extra_info_index = [translated_query[i] for i in extra_query_index]
     return og_article_sentences, translated_article_sentences, missing_info_index, extra_info_index
 
 def universal_sentences_split(text):
@@ -75,56 +365,38 @@ def universal_sentences_split(text):
         "sentences": [array of split sentences]
     }
     """
-    sentences = []
-    for sentence in text.replace('!', '.').replace('?', '.').split('.'):
-        if sentence.strip():
-            sentences.append(sentence.strip())
-    return sentences
+    return [s.strip() for s in _SENT_SPLIT.split(text) if s.strip()]
 
 def preprocess_input(article, language):
     """
-    Preprocesses input text based on language using appropriate spaCy model.
-    
+    Preprocesses input text based on language using a spaCy sentencizer.
+
     Expected parameters:
     {
         "article": "string - article text to preprocess",
         "language": "string - language code for the article"
     }
-    
+
     Returns:
     {
         "sentences": [array of preprocessed sentences]
     }
     """
-    # Define a mapping of languages to spaCy model names
-    language_model_map = {
-        "en": "en_core_web_sm",  # English
-        "de": "de_core_news_sm",  # German
-        "fr": "fr_core_news_sm",  # French
-        "es": "es_core_news_sm",  # Spanish
-        "it": "it_core_news_sm",  # Italian
-        "pt": "pt_core_news_sm",  # Portuguese
-        "nl": "nl_core_news_sm",  # Dutch
-    }
-    
-    # Acommodate for TITLES
-    cleaned_article = article.replace('\n\n', '<DOUBLE_NEWLINE>') # temporarily replace double newlines
-    cleaned_article = cleaned_article.replace('\n', '.') # replace single newlines with periods
-    cleaned_article = cleaned_article.replace('<DOUBLE_NEWLINE>', ' ').strip() # remove double newlines
-    
-    # Check if the language is supported
-    if language not in language_model_map:
-        sentences = universal_sentences_split(cleaned_article)  # Fallback to universal sentence splitting
-        return sentences
-    else:
-    # Load the appropriate spaCy model
-        model_name = language_model_map[language]
-        nlp = spacy.load(model_name)
-
-        # Process the article and extract sentences
-        doc = nlp(cleaned_article)
-        sentences = [sent.text for sent in doc.sents]
-        return sentences
+    # Acommodate for TITLES: one regex pass instead of three string rebuilds
+    cleaned_article = _NEWLINE_RUN.sub(
+        lambda m: ' ' if len(m.group()) > 1 else '.', article
+    ).strip()
+
+    # Check if the language is supported by spaCy
+    try:
+        nlp = _get_nlp(language)
+    except ImportError:
+        return universal_sentences_split(cleaned_article)  # Fallback to universal sentence splitting
+
+    # Process the article and extract sentences
+    doc = nlp(cleaned_article)
+    sentences = [sent.text for sent in doc.sents]
+    return sentences
 
 def sentences_diff(article_sentences, first_embeddings, second_embeddings, sim_threshold):
     """
@@ -144,36 +416,39 @@ def sentences_diff(article_sentences, first_embeddings, second_embeddings, sim_t
         "indices": [array of indices where differences occur]
     }
     """
-    diff_info = []
-    indices = []  # Track the indices of differing sentences
-    for i, eng_embedding in enumerate(first_embeddings):
-        # Calculate similarity between the current English sentence and all French sentences
-        similarities = cosine_similarity([eng_embedding], second_embeddings)[0]
-
-        # Find the best matching sentences
-        max_sim = max(similarities)
+    if len(first_embeddings) == 0:
+        return [], []
+    if len(second_embeddings) == 0:
+        # Nothing to match against: every sentence is a difference
+        return list(article_sentences), list(range(len(article_sentences)))
 
-        if max_sim < sim_threshold:  # Threshold for similarity
-            diff_info.append(article_sentences[i])  # This sentence might be missing or extra
-            indices.append(i)
-            
+    unmatched = _unmatched_mask(first_embeddings, second_embeddings, sim_threshold)
+    indices = np.nonzero(unmatched)[0].tolist()
+    diff_info = [article_sentences[i] for i in indices]
     return diff_info, indices
 
-def perform_semantic_comparison(request_data):
+def perform_semantic_comparison(
+    source_article,
+    target_article,
+    source_language="en",
+    target_language="en",
+    sim_threshold=0.65,
+    model_name="sentence-transformers/LaBSE",
+):
     """
-    Process the JSON request data and perform semantic comparison
-    
-    Expected JSON format:
+    Performs semantic comparison between two article texts.
+
+    Expected parameters:
     {
-        "article_text_blob_1": "string",
-        "article_text_blob_2": "string",
-        "article_text_blob_1_language": "string",
-        "article_text_blob_2_language": "string",
-        "comparison_threshold": 0,
-        "model_name": "string"
+        "source_article": "string - first article text",
+        "target_article": "string - second article text",
+        "source_language": "string - language code of first article",
+        "target_language": "string - language code of second article",
+        "sim_threshold": "float - similarity threshold value",
+        "model_name": "string - name of the transformer model to use"
     }
-    
-        Returns:
+
+    Returns:
     {
         "comparisons": [
             {
@@ -185,13 +460,8 @@ def perform_semantic_comparison(request_data):
         ]
     }
     """
-    # Extract values from request data
-    source_article = request_data["article_text_blob_1"]
-    target_article = request_data["article_text_blob_2"]
-    source_language = request_data["article_text_blob_1_language"]
-    target_language = request_data["article_text_blob_2_language"]
-    sim_threshold = request_data["comparison_threshold"] or 0.65  # Default to 0.65 if 0
-    model_name = request_data["model_name"] or "LaBSE"  # Default to LaBSE if not specified
+    sim_threshold = sim_threshold or 0.65  # Default to 0.65 if 0
+    model_name = model_name or "LaBSE"  # Default to LaBSE if not specified
 
     # Perform semantic comparison
     source_sentences, target_sentences, missing_info_index, extra_info_index = semantic_compare(
@@ -218,16 +488,14 @@ def perform_semantic_comparison(request_data):
 
 def main(): #testing the code
     # Example test request data
-    test_request = {
-        "article_text_blob_1": "This is the first sentence.\n\nThis is the second sentence\nThis is the third sentence.",
-        "article_text_blob_2": "\n\nCeci est la première phrase\nJe vais bien. Ceci est la deuxième phrase.",
-        "article_text_blob_1_language": "en",
-        "article_text_blob_2_language": "fr",
-        "comparison_threshold": 0.65,
-        "model_name": "sentence-transformers/LaBSE"
-    }
-    
-    result = perform_semantic_comparison(test_request)
+    result = perform_semantic_comparison(
+        "This is the first sentence.\n\nThis is the second sentence\nThis is the third sentence.",
+        "\n\nCeci est la première phrase\nJe vais bien. Ceci est la deuxième phrase.",
+        source_language="en",
+        target_language="fr",
+        sim_threshold=0.65,
+        model_name="sentence-transformers/LaBSE",
+    )
     print("Comparison Results:", result)
 
 
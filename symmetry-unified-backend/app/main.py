@@ -1,8 +1,10 @@
+import asyncio
 import logging
 from traceback import format_exc
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from starlette.config import Config
 from starlette.requests import Request
 from starlette.responses import JSONResponse
@@ -10,10 +12,17 @@ import uvicorn
 
 from app.routers import wiki_articles, comparison, structured_wiki, structural_analysis
 
+try:
+    from app.ai.semantic_comparison import _get_model, _get_nlp
+except Exception:
+    _get_model = None
+    _get_nlp = None
+
 config = Config(".env")
 
 LOG_LEVEL = config.get("LOG_LEVEL", default="INFO")
 FASTAPI_DEBUG = config.get("FASTAPI_DEBUG", cast=bool, default=False)
+PRELOAD_MODELS = config.get("PRELOAD_MODELS", cast=bool, default=False)
 
 comparison_models = [
     "sentence-transformers/LaBSE",
@@ -23,9 +32,18 @@ comparison_models = [
     "multi-qa-mpnet-base-cos-v1",
 ]
 
+preload_languages = ["en", "de", "fr", "es", "it", "pt", "nl"]
+
 logging.basicConfig(level=LOG_LEVEL, format="%(asctime)s - %(levelname)s - %(message)s")
 
-app = FastAPI(debug=FASTAPI_DEBUG, title="Symmetry Unified API", version="1.0.0")
+# orjson serializes in C, which matters for comparison responses carrying
+# hundreds of sentences per array
+app = FastAPI(
+    debug=FASTAPI_DEBUG,
+    title="Symmetry Unified API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 
 async def http_exception_handler(request: Request, exc: HTTPException):
@@ -54,6 +72,30 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+async def warm_model_cache():
+    """Populate the SentenceTransformer and sentencizer caches so the first
+    request to each model does not pay download/load time under the HTTP
+    timeout. Opt-in via PRELOAD_MODELS: deployments without the models on
+    disk (or without network to fetch them) and the test suite must not
+    fail or stall at startup, and a failed warm-up only means the model
+    loads lazily on first use."""
+    if not PRELOAD_MODELS or _get_model is None:
+        logging.info("Model preloading disabled; models load lazily on first use.")
+        return
+
+    results = await asyncio.gather(
+        *[asyncio.to_thread(_get_model, name) for name in comparison_models],
+        *[asyncio.to_thread(_get_nlp, lang) for lang in preload_languages],
+        return_exceptions=True,
+    )
+    failures = [result for result in results if isinstance(result, Exception)]
+    for failure in failures:
+        logging.warning(f"Model warm-up failed, will load lazily: {failure}")
+    if not failures:
+        logging.info("Comparison models and sentence splitters loaded.")
+
+
 app.include_router(wiki_articles.router)
 app.include_router(comparison.router)
 app.include_router(structured_wiki.router)
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import List
 
@@ -32,7 +33,7 @@ comparison_models = [
 
 
 @router.post("/articles/compare", response_model=CompareResponse)
-def compare_articles(payload: CompareRequest):
+async def compare_articles(payload: CompareRequest):
     """
     This endpoint requests a comparison of two blobs of text using semantic comparison.
     The request includes the articles, the languages of the articles, the comparison threshold, and model name.
@@ -49,12 +50,22 @@ def compare_articles(payload: CompareRequest):
             ]
         }
     else:
-        result = perform_semantic_comparison(payload.dict())
+        # Attribute access avoids the deep copy of both article blobs that
+        # payload.dict() would make
+        result = await asyncio.to_thread(
+            perform_semantic_comparison,
+            payload.article_text_blob_1,
+            payload.article_text_blob_2,
+            payload.article_text_blob_1_language,
+            payload.article_text_blob_2_language,
+            payload.comparison_threshold,
+            payload.model_name,
+        )
     return result
 
 
 @router.get("/comparison/llm", response_model=ArticleComparisonResponse)
-def compare_articles_llm(text_a: str, text_b: str):
+async def compare_articles_llm(text_a: str, text_b: str):
     logging.info("Calling LLM semantic comparison endpoint.")
 
     if text_a is None or text_b is None:
@@ -64,7 +75,7 @@ def compare_articles_llm(text_a: str, text_b: str):
             detail="Either text_a or text_b (or both) was found to be None.",
         )
 
-    output = llm_semantic_comparison(text_a, text_b)
+    output = await asyncio.to_thread(llm_semantic_comparison, text_a, text_b)
     return ArticleComparisonResponse(
         missing_info=output.get("missing_info", []),
         extra_info=output.get("extra_info", []),
@@ -72,10 +83,10 @@ def compare_articles_llm(text_a: str, text_b: str):
 
 
 @router.post("/comparison/llm", response_model=ArticleComparisonResponse)
-def compare_articles_llm_post(payload: LLMCompareRequest):
+async def compare_articles_llm_post(payload: LLMCompareRequest):
     logging.info("Calling LLM semantic comparison endpoint (POST).")
 
-    output = llm_semantic_comparison(payload.text_a, payload.text_b)
+    output = await asyncio.to_thread(llm_semantic_comparison, payload.text_a, payload.text_b)
     return ArticleComparisonResponse(
         missing_info=output.get("missing_info", []),
         extra_info=output.get("extra_info", []),
@@ -83,7 +94,7 @@ def compare_articles_llm_post(payload: LLMCompareRequest):
 
 
 @router.get("/comparison/semantic", response_model=ArticleComparisonResponse)
-def compare_articles_semantic(
+async def compare_articles_semantic(
     text_a: str,
     text_b: str,
     similarity_threshold: float = 0.75,
@@ -118,15 +129,14 @@ def compare_articles_semantic(
     if perform_semantic_comparison is None:
         return ArticleComparisonResponse(missing_info=[], extra_info=[])
 
-    result = perform_semantic_comparison(
-        {
-            "article_text_blob_1": text_a,
-            "article_text_blob_2": text_b,
-            "article_text_blob_1_language": "en",
-            "article_text_blob_2_language": "en",
-            "comparison_threshold": similarity_threshold,
-            "model_name": model_name,
-        }
+    result = await asyncio.to_thread(
+        perform_semantic_comparison,
+        text_a,
+        text_b,
+        "en",
+        "en",
+        similarity_threshold,
+        model_name,
     )
 
     return ArticleComparisonResponse(
@@ -144,70 +154,9 @@ def compare_articles_semantic(
         ],
     )
 
-    return ArticleComparisonResponse(missing_info=[], extra_info=[])
-
-    result = perform_semantic_comparison(
-        {
-            "article_text_blob_1": text_a,
-            "article_text_blob_2": text_b,
-            "article_text_blob_1_language": "en",
-            "article_text_blob_2_language": "en",
-            "comparison_threshold": similarity_threshold,
-            "model_name": model_name,
-        }
-    )
-
-    return ArticleComparisonResponse(
-        missing_info=[
-            MissingInfo(sentence=sent, index=idx)
-            for sent, idx in zip(
-                result["comparisons"][0]["left_article_missing_info_index"],
-                result["comparisons"][0]["left_article_missing_info_index"],
-            )
-        ],
-        extra_info=[
-            ExtraInfo(sentence=sent, index=idx)
-            for sent, idx in zip(
-                result["comparisons"][0]["right_article_extra_info_index"],
-                result["comparisons"][0]["right_article_extra_info_index"],
-            )
-        ],
-    )
-
-    from app.ai.semantic_comparison import perform_semantic_comparison
-
-    request_data = {
-        "article_text_blob_1": text_a,
-        "article_text_blob_2": text_b,
-        "article_text_blob_1_language": "en",
-        "article_text_blob_2_language": "en",
-        "comparison_threshold": similarity_threshold,
-        "model_name": model_name,
-    }
-
-    result = perform_semantic_comparison(request_data)
-
-    if result and result.get("comparisons"):
-        comp = result["comparisons"][0]
-        missing_items = [
-            comp["left_article_array"][i]
-            for i in comp["left_article_missing_info_index"]
-        ]
-        extra_items = [
-            comp["right_article_array"][i]
-            for i in comp["right_article_extra_info_index"]
-        ]
-
-        return ArticleComparisonResponse(
-            missing_info=[{"sentence": item, "index": -1} for item in missing_items],
-            extra_info=[{"sentence": item, "index": -1} for item in extra_items],
-        )
-
-    return ArticleComparisonResponse(missing_info=[], extra_info=[])
-
 
 @router.post("/comparison/semantic", response_model=ArticleComparisonResponse)
-def compare_articles_semantic_post(payload: SemanticCompareRequest):
+async def compare_articles_semantic_post(payload: SemanticCompareRequest):
     logging.info("Calling semantic comparison endpoint (POST).")
 
     if payload.similarity_threshold < 0 or payload.similarity_threshold > 1:
@@ -229,16 +178,15 @@ def compare_articles_semantic_post(payload: SemanticCompareRequest):
     if perform_semantic_comparison is None:
         return ArticleComparisonResponse(missing_info=[], extra_info=[])
 
-    request_data = {
-        "article_text_blob_1": payload.text_a,
-        "article_text_blob_2": payload.text_b,
-        "article_text_blob_1_language": "en",
-        "article_text_blob_2_language": "en",
-        "comparison_threshold": payload.similarity_threshold,
-        "model_name": payload.model_name,
-    }
-
-    result = perform_semantic_comparison(request_data)
+    result = await asyncio.to_thread(
+        perform_semantic_comparison,
+        payload.text_a,
+        payload.text_b,
+        "en",
+        "en",
+        payload.similarity_threshold,
+        payload.model_name,
+    )
 
     if result and result.get("comparisons"):
         comp = result["comparisons"][0]
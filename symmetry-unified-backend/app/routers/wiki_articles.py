@@ -1,9 +1,12 @@
+import json
 import logging
 import asyncio
 import urllib.request
+from functools import lru_cache
+from pathlib import Path
 from urllib.parse import urlparse
 from urllib.error import URLError
-from typing import Dict, Optional, Annotated
+from typing import Optional, Annotated
 
 import wikipediaapi
 from fastapi import APIRouter, Query, HTTPException, Request
@@ -13,7 +16,10 @@ from app.services.cache import get_cached_article, set_cached_article
 
 router = APIRouter(prefix="/symmetry/v1/wiki", tags=["wiki"])
 
-language_cache: Dict[str, bool] = {}
+# Known Wikipedia subdomain codes, generated from the List of Wikipedias.
+# Membership here validates a language without any network round-trip.
+_WIKI_LANGS_PATH = Path(__file__).parent.parent / "data" / "wiki_langs.json"
+VALID_WIKI_LANGS = frozenset(json.loads(_WIKI_LANGS_PATH.read_text()))
 
 
 @router.get("/articles", response_model=SourceArticleResponse)
@@ -60,7 +66,7 @@ async def get_article(
     if not page.exists():
         raise HTTPException(status_code=404, detail="Article not found.")
 
-    article_content = page.text
+    article_content = _page_text(page)
     languages = list(page.langlinks.keys()) if page.langlinks else []
 
     set_cached_article(lang + "." + title, article_content, languages)
@@ -68,6 +74,31 @@ async def get_article(
     return {"sourceArticle": article_content, "articleLanguages": languages}
 
 
+def _page_text(page) -> str:
+    """Builds the full article text by walking the section tree into a list
+    and joining once. wikipediaapi's page.text grows a string with repeated
+    concatenation per section, which gets expensive on 100+ KB articles.
+
+    The output matches page.text byte for byte: summary followed by a blank
+    line, then per section the title, a single newline, and the body
+    followed by a blank line (sections with no body get no blank line)."""
+    sections = getattr(page, "sections", None)
+    if not isinstance(sections, list):
+        return page.text
+
+    parts = [page.summary + "\n\n"] if page.summary else []
+
+    def collect(section_list):
+        for section in section_list:
+            parts.append(section.title + "\n")
+            if section.text:
+                parts.append(section.text + "\n\n")
+            collect(section.sections)
+
+    collect(sections)
+    return "".join(parts).strip()
+
+
 async def validate_url(url: str) -> tuple[str, str]:
     parsed_url = urlparse(url)
 
@@ -124,34 +155,39 @@ def _extract_wiki_title(url: str) -> str:
     return title.replace("_", " ")
 
 
-async def validate_language_code(language_code: str):
-    if language_code in language_cache:
-        logging.info(f"Using cached validation for language code: {language_code}")
-        return language_cache[language_code]
-
+@lru_cache(maxsize=512)
+def _check_language_online(language_code: str) -> bool:
+    """Checks whether a Wikipedia exists for the code by fetching its main
+    page. Only definitive answers are cached: transient network errors
+    propagate uncached so the next request retries instead of permanently
+    blocking a valid language."""
     url = f"https://{language_code}.wikipedia.org/wiki/Main_Page"
+    response = urllib.request.urlopen(url)
+    return response.status == 200
 
-    try:
-        response = await asyncio.to_thread(urllib.request.urlopen, url)
-
-        if response.status == 200:
-            logging.info(f"Valid language code: {language_code}")
-            language_cache[language_code] = True
-            return True
-        else:
-            language_cache[language_code] = False
-            raise HTTPException(
-                status_code=400, detail=f"Invalid language code '{language_code}'."
-            )
 
+async def validate_language_code(language_code: str):
+    if language_code in VALID_WIKI_LANGS:
+        return True
+
+    # Unknown codes fall through to a live check in case a Wikipedia was
+    # launched after the shipped snapshot was generated
+    try:
+        valid = await asyncio.to_thread(_check_language_online, language_code)
     except URLError:
-        language_cache[language_code] = False
         raise HTTPException(
             status_code=400, detail=f"Invalid language code '{language_code}'."
         )
     except Exception as e:
-        language_cache[language_code] = False
         raise HTTPException(
             status_code=500,
             detail=f"Error occurred during language code validation: {str(e)}",
         )
+
+    if not valid:
+        raise HTTPException(
+            status_code=400, detail=f"Invalid language code '{language_code}'."
+        )
+
+    logging.info(f"Valid language code: {language_code}")
+    return True
@@ -0,0 +1,103 @@
+import hashlib
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+DB_PATH = Path(__file__).resolve().parents[2] / "embeddings.db"
+
+# Embeddings are stored as float16 bytes (~1.5 KB for a 768-d vector), which
+# is plenty of precision for a thresholded cosine comparison.
+STORAGE_DTYPE = np.float16
+
+# Lookups use one SQL variable per key; batch them to stay well under
+# SQLite's default variable limit (999 before 3.32) on very long articles
+SELECT_BATCH = 500
+
+
+class EmbeddingCache:
+    """
+    Content-addressed on-disk cache of sentence embeddings.
+
+    Rows are keyed by sha256(model_name || sentence), so identical sentences
+    compared again - the common case when the same Wikipedia articles are
+    re-requested with a different threshold or language pair - skip the
+    transformer forward pass entirely.
+    """
+
+    def __init__(self, db_path: Path = DB_PATH):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (hash BLOB PRIMARY KEY, vec BLOB)"
+        )
+        self._conn.commit()
+
+    def _get_cache_key(self, model_name: str, sentence: str) -> bytes:
+        return hashlib.sha256((model_name + "\x00" + sentence).encode()).digest()
+
+    def get_many(
+        self, model_name: str, sentences: List[str]
+    ) -> List[Optional[np.ndarray]]:
+        keys = [self._get_cache_key(model_name, s) for s in sentences]
+        if not keys:
+            return []
+
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), SELECT_BATCH):
+                batch = keys[start:start + SELECT_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT hash, vec FROM embeddings WHERE hash IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                found.update(rows)
+        vectors: List[Optional[np.ndarray]] = [
+            np.frombuffer(found[key], dtype=STORAGE_DTYPE).astype(np.float32)
+            if key in found
+            else None
+            for key in keys
+        ]
+        hits = len(found)
+        logging.info(
+            f"[EMBEDDING CACHE] {hits}/{len(sentences)} sentences served from cache"
+        )
+        return vectors
+
+    def set_many(
+        self, model_name: str, sentences: List[str], vectors: np.ndarray
+    ) -> None:
+        rows = [
+            (
+                self._get_cache_key(model_name, sentence),
+                np.asarray(vector, dtype=STORAGE_DTYPE).tobytes(),
+            )
+            for sentence, vector in zip(sentences, vectors)
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO embeddings (hash, vec) VALUES (?, ?)", rows
+            )
+            self._conn.commit()
+
+
+_embedding_cache = EmbeddingCache()
+
+
+def get_cached_embeddings(
+    model_name: str, sentences: List[str]
+) -> List[Optional[np.ndarray]]:
+    return _embedding_cache.get_many(model_name, sentences)
+
+
+def set_cached_embeddings(
+    model_name: str, sentences: List[str], vectors: np.ndarray
+) -> None:
+    _embedding_cache.set_many(model_name, sentences, vectors)
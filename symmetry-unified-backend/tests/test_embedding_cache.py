@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from app.services.embedding_cache import EmbeddingCache, SELECT_BATCH
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Embedding cache backed by a throwaway database file"""
+    return EmbeddingCache(db_path=tmp_path / "embeddings.db")
+
+
+class TestEmbeddingCache:
+    """Tests for the on-disk embedding cache"""
+
+    def test_set_get_roundtrip(self, cache):
+        """Test that stored vectors come back as float32 within fp16 precision"""
+        sentences = ["First sentence.", "Second sentence."]
+        vectors = np.random.default_rng(0).uniform(-1, 1, (2, 16)).astype(np.float32)
+
+        cache.set_many("test-model", sentences, vectors)
+        result = cache.get_many("test-model", sentences)
+
+        assert len(result) == 2
+        for stored, original in zip(result, vectors):
+            assert stored.dtype == np.float32
+            assert np.allclose(stored, original, atol=1e-3)
+
+    def test_miss_returns_none_in_order(self, cache):
+        """Test that misses stay None at the right positions"""
+        cache.set_many("test-model", ["cached sentence"], np.ones((1, 4), np.float32))
+
+        result = cache.get_many(
+            "test-model", ["missing one", "cached sentence", "missing two"]
+        )
+
+        assert result[0] is None
+        assert np.allclose(result[1], np.ones(4))
+        assert result[2] is None
+
+    def test_keyed_by_model_name(self, cache):
+        """Test that the same sentence under another model is a miss"""
+        cache.set_many("model-a", ["shared sentence"], np.ones((1, 4), np.float32))
+
+        assert cache.get_many("model-b", ["shared sentence"]) == [None]
+
+    def test_lookup_larger_than_select_batch(self, cache):
+        """Test that lookups spanning several SQL batches stay correct"""
+        count = SELECT_BATCH * 2 + 50
+        sentences = [f"sentence {i}" for i in range(count)]
+        vectors = np.arange(count, dtype=np.float32).reshape(count, 1)
+
+        cache.set_many("test-model", sentences, vectors)
+        result = cache.get_many("test-model", sentences)
+
+        assert all(vec is not None for vec in result)
+        # Small integers are exactly representable in float16
+        assert np.array_equal(np.vstack(result), vectors)
+
+    def test_empty_lookup(self, cache):
+        """Test that an empty sentence list short-circuits"""
+        assert cache.get_many("test-model", []) == []
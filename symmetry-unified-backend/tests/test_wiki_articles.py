@@ -165,3 +165,59 @@ class TestWikiArticlesRouter:
 
                 assert response.status_code == 200
                 mock_wikipediaapi_fresh.page.assert_called_once()
+
+    def test_page_text_matches_wikipediaapi(self):
+        """Test that _page_text reproduces wikipediaapi's page.text exactly"""
+        from app.routers.wiki_articles import _page_text
+
+        class FakeSection:
+            """Mirrors wikipediaapi.WikipediaPageSection.full_text"""
+
+            def __init__(self, title, text, sections=None):
+                self.title = title
+                self.text = text
+                self.sections = sections or []
+
+            def full_text(self, level=1):
+                res = self.title + "\n"
+                if len(self.text) > 0:
+                    res += self.text
+                    res += "\n\n"
+                for sec in self.sections:
+                    res += sec.full_text(level + 1)
+                return res
+
+        class FakePage:
+            """Mirrors wikipediaapi.WikipediaPage.text"""
+
+            def __init__(self, summary, sections):
+                self.summary = summary
+                self.sections = sections
+
+            @property
+            def text(self):
+                txt = self.summary
+                if len(txt) > 0:
+                    txt += "\n\n"
+                for sec in self.sections:
+                    txt += sec.full_text(level=1)
+                return txt.strip()
+
+        page = FakePage(
+            summary="Lead paragraph of the article.",
+            sections=[
+                FakeSection(
+                    "History",
+                    "Founded in antiquity.",
+                    sections=[FakeSection("Middle Ages", "Castle built.")],
+                ),
+                FakeSection("See also", ""),
+                FakeSection("References", "Some references."),
+            ],
+        )
+
+        assert _page_text(page) == page.text
+
+        # No summary: the section tree alone must still match
+        bare_page = FakePage(summary="", sections=page.sections)
+        assert _page_text(bare_page) == bare_page.text